@@ -4,13 +4,19 @@ Launch an interactive Datasette web app for the NBA database.
 Opens http://127.0.0.1:8001 in your browser with:
 """
 
-import subprocess
-import datasette
+import json
 import sys
 import os
+import threading
+import webbrowser
+
+import uvicorn
+from datasette.app import Datasette
 
 DB_PATH = "nba.db"
 METADATA_PATH = "metadata.json"
+HOST = "127.0.0.1"
+PORT = 8001
 
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
@@ -19,9 +25,16 @@ if not os.path.exists(DB_PATH):
     print(f"Error: {DB_PATH} not found in {os.getcwd()}")
     sys.exit(1)
 
-# Launch command
-cmd = [sys.executable, "-m", "datasette", DB_PATH, "--open"]
+metadata = None
 if os.path.exists(METADATA_PATH):
-    cmd.extend(["--metadata", METADATA_PATH])
+    with open(METADATA_PATH) as f:
+        metadata = json.load(f)
+
+# Run the Datasette app in this process instead of starting a second
+# Python interpreter through the datasette CLI
+ds = Datasette(files=[DB_PATH], metadata=metadata)
+
+# Open the browser once the server has had a moment to start
+threading.Timer(1.0, lambda: webbrowser.open(f"http://{HOST}:{PORT}/")).start()
 
-subprocess.call(cmd)
+uvicorn.run(ds.app(), host=HOST, port=PORT)